@@ -7,7 +7,7 @@ Official SDK for interacting with Breaking the Limits APIs:
 - Forge Bridge: VFS and repository access
 """
 
-from .client import Client
+from .client import Client, install_uvloop
 from .constitution import ConstitutionClient
 from .memory import MemoryClient
 from .bridge import BridgeClient
@@ -32,6 +32,7 @@ __version__ = "1.0.0"
 __all__ = [
     # Main client
     "Client",
+    "install_uvloop",
     # Service clients
     "ConstitutionClient",
     "MemoryClient",
@@ -0,0 +1,139 @@
+"""
+Shared HTTP transport configuration
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from urllib.request import getproxies
+
+import httpx
+import orjson
+
+from .auth import PersonaAuthenticator
+
+ATTESTATION_HEADER = "X-Persona-Attestation"
+
+# Bodies are sent as pre-serialized bytes, so httpx cannot infer the
+# type; every request with a JSON body passes this explicitly
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# Headers shared by every client; credentials are merged in per client
+_BASE_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "User-Agent": "bravozero-python/1.0.0",
+})
+
+# numpy arrays (e.g. embeddings) serialize natively; naive datetimes
+# in metadata are sent as UTC
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+# Proxy settings httpx reads from the environment (HTTP_PROXY etc.)
+_PROXY_SCHEMES = frozenset({"http", "https", "all"})
+
+# Connection pools are kept alive across calls, so only the first
+# request on a connection pays for the TCP and TLS handshakes. Over
+# HTTP/2 concurrent requests multiplex as streams on one connection per
+# host, so few connections are kept warm. The cap stays at the HTTP/1.1
+# level because a server without HTTP/2 falls back to one connection
+# per in-flight request.
+HTTP2_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# HTTP/1.1 needs one connection per in-flight request; keep more of them
+# warm, for longer, to absorb bursts of concurrent calls.
+HTTP1_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
+)
+
+
+def default_headers(api_key: str, agent_id: str) -> Dict[str, str]:
+    """Get default headers for requests."""
+    return {"X-API-Key": api_key, "X-Agent-ID": agent_id, **_BASE_HEADERS}
+
+
+class RequestHeaders:
+    """
+    Headers a service client adds to individual requests.
+    
+    The authenticator's ``create_attestation`` is resolved once, so
+    unsigned requests skip the attestation await entirely.
+    
+    A client that creates its own pool, or is given ``Client``'s pool,
+    relies on the credentials in the pool defaults. A client given any
+    other pool cannot rely on that pool's defaults, so it passes
+    ``credentials`` to send them with every request.
+    """
+    
+    def __init__(
+        self,
+        authenticator: Optional[PersonaAuthenticator] = None,
+        credentials: Optional[Mapping[str, str]] = None,
+    ):
+        self._attest = authenticator.create_attestation if authenticator else None
+        self._credentials = dict(credentials or {})
+    
+    def unsigned(self, *extra: Mapping[str, str]) -> Optional[Dict[str, str]]:
+        """Merge credentials and ``extra``, or None when there is nothing."""
+        if not (self._credentials or extra):
+            return None
+        headers = dict(self._credentials)
+        for mapping in extra:
+            headers.update(mapping)
+        return headers
+    
+    async def signed(self, *extra: Mapping[str, str]) -> Optional[Dict[str, str]]:
+        """Like ``unsigned``, plus a fresh attestation when signing is set up."""
+        headers = self.unsigned(*extra)
+        if self._attest is None:
+            return headers
+        attestation = await self._attest()
+        if headers is None:
+            return {ATTESTATION_HEADER: attestation}
+        headers[ATTESTATION_HEADER] = attestation
+        return headers
+
+
+def dump_json(body: Any) -> bytes:
+    """Serialize a request body to JSON bytes."""
+    return orjson.dumps(body, option=_JSON_OPTIONS)
+
+
+def create_http_client(
+    base_url: str,
+    headers: Dict[str, str],
+    timeout: float,
+    http2: bool = True,
+) -> httpx.AsyncClient:
+    """
+    Create an AsyncClient backed by a keep-alive connection pool.
+    
+    HTTP/2 is negotiated when the server supports it; with
+    ``http2=False`` the pool is sized for HTTP/1.1 instead. HTTP/2 is
+    only negotiated over TLS, so plain ``http://`` URLs (e.g. a local
+    development server) always get the HTTP/1.1 pool.
+    
+    A failed connect is retried once. httpx only honours proxy
+    environment variables when it builds the transports itself, so
+    with a proxy configured the retry is skipped rather than the proxy.
+    """
+    http2 = http2 and base_url.startswith("https://")
+    limits = HTTP2_LIMITS if http2 else HTTP1_LIMITS
+    transport = None
+    if not _PROXY_SCHEMES & getproxies().keys():
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2, limits=limits, retries=1
+        )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        # Fail fast on unreachable hosts without capping slow responses
+        timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+        headers=headers,
+        http2=http2,
+        limits=limits,
+        transport=transport,
+    )
@@ -4,22 +4,45 @@ PERSONA Authentication
 Handles Ed25519 signing for PERSONA attestation.
 """
 
+import asyncio
 import base64
+import itertools
 import json
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+try:
+    from nacl.bindings import (
+        crypto_sign_ed25519ph_final_create,
+        crypto_sign_ed25519ph_state,
+        crypto_sign_ed25519ph_update,
+        crypto_sign_seed_keypair,
+    )
+    from nacl.signing import SigningKey
+except ImportError:  # PyNaCl is an optional speedup
+    SigningKey = None
+
+_ENVELOPE_TEMPLATE = b'{"payload": "%s", "signature": "%s", "algorithm": "%s"}'
+
 
 class PersonaAuthenticator:
     """
     PERSONA authenticator for signing attestations.
     
     Uses Ed25519 signatures to create cryptographically
-    verifiable attestations for API requests.
+    verifiable attestations for API requests. When PyNaCl is
+    installed (``pip install bravozero[speedups]``) signing goes
+    through libsodium instead of OpenSSL.
+    
+    Every attestation is signed fresh by default, with a unique nonce
+    and the current timestamp. Setting ``attestation_ttl`` lets bursts
+    of requests share one signature per action, but those requests then
+    carry the same nonce and timestamp, so only enable it for servers
+    that do not enforce replay or freshness checks.
     """
     
     def __init__(
@@ -27,6 +50,9 @@ class PersonaAuthenticator:
         agent_id: str,
         private_key_path: Optional[Path] = None,
         private_key_bytes: Optional[bytes] = None,
+        attestation_ttl: float = 0.0,
+        prehash: bool = False,
+        raw_envelope: bool = False,
     ):
         """
         Initialize the authenticator.
@@ -35,8 +61,24 @@ class PersonaAuthenticator:
             agent_id: PERSONA agent identifier
             private_key_path: Path to Ed25519 private key PEM file
             private_key_bytes: Raw private key bytes (alternative to path)
+            attestation_ttl: Seconds a signed attestation, including its
+                nonce, is reused for the same action. 0 (the default)
+                signs every request.
+            prehash: Sign with Ed25519ph (SHA-512 prehash) and tag the
+                attestation as such. Requires PyNaCl and a server that
+                accepts the "Ed25519ph" algorithm.
+            raw_envelope: Send the attestation envelope as plain JSON
+                instead of base64-encoding it a second time, which makes
+                the header about 25% shorter. Requires server support.
         """
         self.agent_id = agent_id
+        self._payload_prefix = (
+            b'"agent_id": ' + json.dumps(agent_id).encode("ascii") + b', "nonce": '
+        )
+        self._nonce_counter = itertools.count()
+        self.attestation_ttl = attestation_ttl
+        self._cache: Dict[Optional[str], Tuple[float, str]] = {}
+        self._lock: Optional[asyncio.Lock] = None
         
         if private_key_path:
             self._private_key = self._load_private_key(private_key_path)
@@ -51,6 +93,23 @@ class PersonaAuthenticator:
         
         if not isinstance(self._private_key, Ed25519PrivateKey):
             raise ValueError("Private key must be Ed25519")
+        
+        self._algorithm = b"Ed25519ph" if prehash else b"Ed25519"
+        self._raw_envelope = raw_envelope
+        self._sign = self._make_signer(self._private_key, prehash)
+        
+        # Public key exports never change, so encode them once
+        public_key = self._private_key.public_key()
+        self._public_key_pem = public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        self._public_key_base64 = base64.b64encode(
+            public_key.public_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PublicFormat.Raw,
+            )
+        ).decode("ascii")
     
     def _load_private_key(self, path: Path) -> Ed25519PrivateKey:
         """Load private key from PEM file."""
@@ -62,6 +121,39 @@ class PersonaAuthenticator:
         
         return key
     
+    @staticmethod
+    def _make_signer(
+        key: Ed25519PrivateKey,
+        prehash: bool = False,
+    ) -> Callable[[bytes], bytes]:
+        """Pick the fastest available Ed25519 signing backend."""
+        if SigningKey is None:
+            if prehash:
+                raise ValueError(
+                    "Ed25519ph signing requires PyNaCl: "
+                    "pip install bravozero[speedups]"
+                )
+            return key.sign
+        
+        seed = key.private_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PrivateFormat.Raw,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        
+        if prehash:
+            _, secret_key = crypto_sign_seed_keypair(seed)
+            
+            def sign_prehashed(message: bytes) -> bytes:
+                state = crypto_sign_ed25519ph_state()
+                crypto_sign_ed25519ph_update(state, message)
+                return crypto_sign_ed25519ph_final_create(state, secret_key)
+            
+            return sign_prehashed
+        
+        signing_key = SigningKey(seed)
+        return lambda message: signing_key.sign(message).signature
+    
     async def create_attestation(
         self,
         action: Optional[str] = None,
@@ -70,56 +162,85 @@ class PersonaAuthenticator:
         """
         Create a signed PERSONA attestation.
         
+        With ``attestation_ttl`` set, a previously signed attestation for
+        the same action is returned while it is younger than that.
+        Passing an explicit nonce always produces a fresh signature.
+        
         Args:
             action: Optional action being attested
             nonce: Optional nonce for replay protection
         
         Returns:
-            Base64-encoded attestation string
+            Base64-encoded attestation string (plain JSON when
+            ``raw_envelope`` is set)
         """
-        timestamp = int(time.time())
+        if nonce is not None or self.attestation_ttl <= 0:
+            return self._sign_attestation(action, nonce)
         
-        # Build attestation payload
-        payload = {
-            "agent_id": self.agent_id,
-            "timestamp": timestamp,
-            "nonce": nonce or f"{timestamp}-{id(self)}",
-        }
+        cached = self._cache.get(action)
+        if cached and time.time() - cached[0] < self.attestation_ttl:
+            return cached[1]
+        
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        # Concurrent callers that missed the cache queue here, and all
+        # but the first pick up the attestation it just signed
+        async with self._lock:
+            now = time.time()
+            cached = self._cache.get(action)
+            if cached and now - cached[0] < self.attestation_ttl:
+                return cached[1]
+            attestation = self._sign_attestation(action, None)
+            self._cache[action] = (now, attestation)
+            return attestation
+    
+    def _sign_attestation(
+        self,
+        action: Optional[str],
+        nonce: Optional[str],
+    ) -> str:
+        """Build and sign a new attestation."""
+        now_ns = time.time_ns()
+        timestamp = now_ns // 1_000_000_000
+        
+        # Build the canonical payload (sorted keys, as json.dumps would)
+        # around the precomputed agent_id fragment
+        if nonce:
+            nonce_json = json.dumps(nonce).encode("ascii")
+        else:
+            # Unique even for attestations signed within the same second
+            nonce_json = b'"%d-%d"' % (now_ns, next(self._nonce_counter))
         
         if action:
-            payload["action"] = action
+            head = b'{"action": %s, ' % json.dumps(action).encode("ascii")
+        else:
+            head = b"{"
         
-        # Serialize payload
-        payload_bytes = json.dumps(payload, sort_keys=True).encode("utf-8")
+        payload_bytes = b'%s%s%s, "timestamp": %d}' % (
+            head,
+            self._payload_prefix,
+            nonce_json,
+            timestamp,
+        )
         
         # Sign with Ed25519
-        signature = self._private_key.sign(payload_bytes)
-        
-        # Combine payload and signature
-        attestation = {
-            "payload": base64.b64encode(payload_bytes).decode("ascii"),
-            "signature": base64.b64encode(signature).decode("ascii"),
-            "algorithm": "Ed25519",
-        }
-        
-        # Return as base64 JSON
-        return base64.b64encode(
-            json.dumps(attestation).encode("utf-8")
-        ).decode("ascii")
+        signature = self._sign(payload_bytes)
+        
+        # Combine payload and signature into the JSON envelope
+        envelope = _ENVELOPE_TEMPLATE % (
+            base64.b64encode(payload_bytes),
+            base64.b64encode(signature),
+            self._algorithm,
+        )
+        if self._raw_envelope:
+            return envelope.decode("ascii")
+        return base64.b64encode(envelope).decode("ascii")
     
     def get_public_key(self) -> bytes:
         """Get the public key in PEM format."""
-        public_key = self._private_key.public_key()
-        return public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
+        return self._public_key_pem
     
     def get_public_key_base64(self) -> str:
         """Get the raw public key as base64."""
-        public_key = self._private_key.public_key()
-        raw = public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw,
-        )
-        return base64.b64encode(raw).decode("ascii")
+        return self._public_key_base64
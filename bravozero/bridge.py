@@ -4,14 +4,30 @@ Forge Bridge Client
 Provides VFS access to repositories through the Forge-Logos bridge.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import AsyncIterator, List, Optional
 
 import httpx
+import orjson
 
-from .types import FileInfo, DirectoryListing, SyncStatus
+from .types import ApiModel, FileInfo, DirectoryListing, SyncStatus
 from .exceptions import BridgeError, RateLimitError
 from .auth import PersonaAuthenticator
+from ._http import (
+    JSON_HEADERS,
+    RequestHeaders,
+    create_http_client,
+    default_headers,
+    dump_json,
+)
+
+_BYTES_HEADERS = {"Accept": "application/octet-stream"}
+
+
+class _ListingResponse(ApiModel):
+    """Wire format of a directory listing, decoded in a single pass."""
+    path: str
+    files: List[FileInfo]
+    total_count: Optional[int] = None
 
 
 class BridgeClient:
@@ -29,6 +45,8 @@ class BridgeClient:
         agent_id: str,
         authenticator: Optional[PersonaAuthenticator] = None,
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        pool_has_credentials: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
@@ -36,26 +54,19 @@ class BridgeClient:
         self.authenticator = authenticator
         self.timeout = timeout
         
-        self._client = httpx.AsyncClient(
-            base_url=f"{self.base_url}/v1/bridge",
+        self._owns_client = http_client is None
+        self._client = http_client or create_http_client(
+            base_url=self.base_url,
+            headers=default_headers(self.api_key, self.agent_id),
             timeout=timeout,
-            headers=self._default_headers(),
         )
-    
-    def _default_headers(self) -> Dict[str, str]:
-        """Get default headers for requests."""
-        return {
-            "X-API-Key": self.api_key,
-            "X-Agent-ID": self.agent_id,
-            "Content-Type": "application/json",
-            "User-Agent": "bravozero-python/1.0.0",
-        }
-    
-    async def _get_attestation(self) -> Optional[str]:
-        """Get PERSONA attestation for request signing."""
-        if self.authenticator:
-            return await self.authenticator.create_attestation()
-        return None
+        # A pool without our default headers needs them on every request
+        self._headers = RequestHeaders(
+            authenticator,
+            None
+            if self._owns_client or pool_has_credentials
+            else default_headers(api_key, agent_id),
+        )
     
     async def list_files(
         self,
@@ -75,12 +86,13 @@ class BridgeClient:
             DirectoryListing with file information
         """
         response = await self._client.get(
-            "/files",
+            "/v1/bridge/files",
             params={
                 "path": path,
                 "recursive": str(recursive).lower(),
                 "pattern": pattern,
             },
+            headers=self._headers.unsigned(),
         )
         
         if response.status_code == 429:
@@ -91,12 +103,16 @@ class BridgeClient:
             )
         
         response.raise_for_status()
-        data = response.json()
+        listing = _ListingResponse.model_validate_json(response.content)
         
         return DirectoryListing(
-            path=data["path"],
-            files=[self._parse_file_info(f) for f in data["files"]],
-            total_count=data.get("totalCount", len(data["files"])),
+            path=listing.path,
+            files=listing.files,
+            total_count=(
+                len(listing.files)
+                if listing.total_count is None
+                else listing.total_count
+            ),
         )
     
     async def read_file(self, path: str) -> str:
@@ -109,38 +125,35 @@ class BridgeClient:
         Returns:
             File contents as string
         """
-        headers = {}
-        attestation = await self._get_attestation()
-        if attestation:
-            headers["X-Persona-Attestation"] = attestation
+        headers = await self._headers.signed()
         
         response = await self._client.get(
-            "/file",
+            "/v1/bridge/file",
             params={"path": path},
             headers=headers,
         )
         
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return data["content"]
     
     async def read_file_bytes(self, path: str) -> bytes:
         """
         Read a file as bytes.
         
+        The whole file is buffered in memory; use ``read_file_stream``
+        for large files.
+        
         Args:
             path: Path to the file
         
         Returns:
             File contents as bytes
         """
-        headers = {"Accept": "application/octet-stream"}
-        attestation = await self._get_attestation()
-        if attestation:
-            headers["X-Persona-Attestation"] = attestation
+        headers = await self._headers.signed(_BYTES_HEADERS)
         
         response = await self._client.get(
-            "/file/bytes",
+            "/v1/bridge/file/bytes",
             params={"path": path},
             headers=headers,
         )
@@ -148,6 +161,33 @@ class BridgeClient:
         response.raise_for_status()
         return response.content
     
+    async def read_file_stream(
+        self,
+        path: str,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a file's contents without buffering the whole file.
+        
+        Args:
+            path: Path to the file
+            chunk_size: Maximum size of each chunk in bytes
+        
+        Yields:
+            Successive chunks of the file contents
+        """
+        headers = await self._headers.signed(_BYTES_HEADERS)
+        
+        async with self._client.stream(
+            "GET",
+            "/v1/bridge/file/bytes",
+            params={"path": path},
+            headers=headers,
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+    
     async def write_file(
         self,
         path: str,
@@ -165,23 +205,20 @@ class BridgeClient:
         Returns:
             FileInfo for the written file
         """
-        headers = {}
-        attestation = await self._get_attestation()
-        if attestation:
-            headers["X-Persona-Attestation"] = attestation
+        headers = await self._headers.signed(JSON_HEADERS)
         
         response = await self._client.put(
-            "/file",
-            json={
+            "/v1/bridge/file",
+            content=dump_json({
                 "path": path,
                 "content": content,
                 "createDirs": create_dirs,
-            },
+            }),
             headers=headers,
         )
         
         response.raise_for_status()
-        return self._parse_file_info(response.json())
+        return FileInfo.model_validate_json(response.content)
     
     async def delete_file(self, path: str) -> bool:
         """
@@ -193,13 +230,10 @@ class BridgeClient:
         Returns:
             True if deleted successfully
         """
-        headers = {}
-        attestation = await self._get_attestation()
-        if attestation:
-            headers["X-Persona-Attestation"] = attestation
+        headers = await self._headers.signed()
         
         response = await self._client.delete(
-            "/file",
+            "/v1/bridge/file",
             params={"path": path},
             headers=headers,
         )
@@ -218,12 +252,13 @@ class BridgeClient:
             FileInfo object
         """
         response = await self._client.get(
-            "/file/info",
+            "/v1/bridge/file/info",
             params={"path": path},
+            headers=self._headers.unsigned(),
         )
         
         response.raise_for_status()
-        return self._parse_file_info(response.json())
+        return FileInfo.model_validate_json(response.content)
     
     async def sync(self, path: str = "/") -> SyncStatus:
         """
@@ -236,19 +271,13 @@ class BridgeClient:
             SyncStatus with sync information
         """
         response = await self._client.post(
-            "/sync",
-            json={"path": path},
+            "/v1/bridge/sync",
+            content=dump_json({"path": path}),
+            headers=self._headers.unsigned(JSON_HEADERS),
         )
         
         response.raise_for_status()
-        data = response.json()
-        
-        return SyncStatus(
-            path=data["path"],
-            synced=data["synced"],
-            last_sync_at=datetime.fromisoformat(data["lastSyncAt"].replace("Z", "+00:00")) if data.get("lastSyncAt") else None,
-            pending_changes=data.get("pendingChanges", 0),
-        )
+        return SyncStatus.model_validate_json(response.content)
     
     async def get_sync_status(self, path: str = "/") -> SyncStatus:
         """
@@ -261,32 +290,21 @@ class BridgeClient:
             SyncStatus object
         """
         response = await self._client.get(
-            "/sync/status",
+            "/v1/bridge/sync/status",
             params={"path": path},
+            headers=self._headers.unsigned(),
         )
         
         response.raise_for_status()
-        data = response.json()
-        
-        return SyncStatus(
-            path=data["path"],
-            synced=data["synced"],
-            last_sync_at=datetime.fromisoformat(data["lastSyncAt"].replace("Z", "+00:00")) if data.get("lastSyncAt") else None,
-            pending_changes=data.get("pendingChanges", 0),
-        )
-    
-    def _parse_file_info(self, data: Dict[str, Any]) -> FileInfo:
-        """Parse file info from API response."""
-        return FileInfo(
-            path=data["path"],
-            name=data["name"],
-            size=data["size"],
-            is_directory=data["isDirectory"],
-            modified_at=datetime.fromisoformat(data["modifiedAt"].replace("Z", "+00:00")),
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")) if data.get("createdAt") else None,
-            permissions=data.get("permissions", ""),
-        )
+        return SyncStatus.model_validate_json(response.content)
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it is shared with other clients."""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def __aenter__(self) -> "BridgeClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -4,7 +4,9 @@ Main Bravo Zero Client
 Provides unified access to all Breaking the Limits services.
 """
 
+import asyncio
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +14,42 @@ from .constitution import ConstitutionClient
 from .memory import MemoryClient
 from .bridge import BridgeClient
 from .auth import PersonaAuthenticator
+from ._http import create_http_client, default_headers
+
+_ENV_URLS = {
+    "production": "https://api.bravozero.ai",
+    "staging": "https://api.staging.bravozero.ai",
+    "development": "http://localhost:8080",
+}
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop (winloop on Windows) for new asyncio event loops.
+    
+    Both are libuv-based loops with cheaper socket I/O than the default
+    selector loop, which shortens request latency under concurrency.
+    They are installed by ``bravozero[speedups]``. Must be called before
+    the event loop starts (e.g. before ``asyncio.run``); it does nothing
+    when a loop is already running.
+    
+    Returns:
+        True if a libuv loop will be used for new event loops
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as libuv_loop
+        else:
+            import uvloop as libuv_loop
+    except ImportError:
+        return False
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.set_event_loop_policy(libuv_loop.EventLoopPolicy())
+        return True
+    return False
 
 
 class Client:
@@ -23,6 +61,10 @@ class Client:
     - Memory Service for persistent memory
     - Forge Bridge for VFS access
     
+    All service clients share one HTTP/2 connection pool, which stays
+    alive between requests, so create one ``Client`` per process and
+    reuse it rather than building a new one for each call.
+    
     Example:
         ```python
         from bravozero import Client
@@ -47,6 +89,13 @@ class Client:
         # Access files
         content = client.bridge.read_file("/project/README.md")
         ```
+    
+    The SDK is fully async; with ``bravozero[speedups]`` installed, call
+    ``bravozero.install_uvloop()`` before starting the event loop to run
+    it on uvloop (winloop on Windows). Memory fan-outs such as
+    ``get_many`` and the batch fallbacks keep at most
+    ``memory.concurrency_limit`` requests in flight so bursts do not
+    trip the server's rate limits.
     """
     
     def __init__(
@@ -57,6 +106,7 @@ class Client:
         base_url: Optional[str] = None,
         environment: str = "production",
         timeout: float = 30.0,
+        http2: bool = True,
     ):
         """
         Initialize the Bravo Zero client.
@@ -68,6 +118,9 @@ class Client:
             base_url: Override the default API base URL.
             environment: Environment to use (production, staging, development).
             timeout: Request timeout in seconds.
+            http2: Multiplex concurrent requests over one HTTP/2 connection.
+                Servers without HTTP/2 are still served over HTTP/1.1; set
+                False to size the pool for HTTP/1.1 from the start.
         """
         self.api_key = api_key or os.environ.get("BRAVOZERO_API_KEY")
         self.agent_id = agent_id or os.environ.get("BRAVOZERO_AGENT_ID")
@@ -102,67 +155,67 @@ class Client:
         else:
             self._authenticator = None
         
-        # Initialize service clients
-        self._constitution: Optional[ConstitutionClient] = None
-        self._memory: Optional[MemoryClient] = None
-        self._bridge: Optional[BridgeClient] = None
+        # One connection pool shared by every service client
+        self._http = create_http_client(
+            base_url=self.base_url,
+            headers=default_headers(self.api_key, self.agent_id),
+            timeout=self.timeout,
+            http2=http2,
+        )
+        
+        # Initialize service clients; no connections open until first use
+        self._constitution = ConstitutionClient(
+            base_url=self.base_url,
+            api_key=self.api_key,
+            agent_id=self.agent_id,
+            authenticator=self._authenticator,
+            timeout=self.timeout,
+            http_client=self._http,
+            pool_has_credentials=True,
+        )
+        self._memory = MemoryClient(
+            base_url=self.base_url,
+            api_key=self.api_key,
+            agent_id=self.agent_id,
+            authenticator=self._authenticator,
+            timeout=self.timeout,
+            http_client=self._http,
+            pool_has_credentials=True,
+        )
+        self._bridge = BridgeClient(
+            base_url=self.base_url,
+            api_key=self.api_key,
+            agent_id=self.agent_id,
+            authenticator=self._authenticator,
+            timeout=self.timeout,
+            http_client=self._http,
+            pool_has_credentials=True,
+        )
+    
+    install_uvloop = staticmethod(install_uvloop)
     
     def _get_base_url(self, environment: str) -> str:
         """Get base URL for environment."""
-        urls = {
-            "production": "https://api.bravozero.ai",
-            "staging": "https://api.staging.bravozero.ai",
-            "development": "http://localhost:8080",
-        }
-        return urls.get(environment, urls["production"])
+        return _ENV_URLS.get(environment, _ENV_URLS["production"])
     
     @property
     def constitution(self) -> ConstitutionClient:
         """Get the Constitution Agent client."""
-        if self._constitution is None:
-            self._constitution = ConstitutionClient(
-                base_url=self.base_url,
-                api_key=self.api_key,
-                agent_id=self.agent_id,
-                authenticator=self._authenticator,
-                timeout=self.timeout,
-            )
         return self._constitution
     
     @property
     def memory(self) -> MemoryClient:
         """Get the Memory Service client."""
-        if self._memory is None:
-            self._memory = MemoryClient(
-                base_url=self.base_url,
-                api_key=self.api_key,
-                agent_id=self.agent_id,
-                authenticator=self._authenticator,
-                timeout=self.timeout,
-            )
         return self._memory
     
     @property
     def bridge(self) -> BridgeClient:
         """Get the Forge Bridge client."""
-        if self._bridge is None:
-            self._bridge = BridgeClient(
-                base_url=self.base_url,
-                api_key=self.api_key,
-                agent_id=self.agent_id,
-                authenticator=self._authenticator,
-                timeout=self.timeout,
-            )
         return self._bridge
     
     async def close(self) -> None:
-        """Close all client connections."""
-        if self._constitution:
-            await self._constitution.close()
-        if self._memory:
-            await self._memory.close()
-        if self._bridge:
-            await self._bridge.close()
+        """Close the shared connection pool."""
+        await self._http.aclose()
     
     async def __aenter__(self) -> "Client":
         return self
@@ -4,14 +4,32 @@ Constitution Agent Client
 Provides governance and alignment enforcement for AI agents.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, List, Optional, Protocol, Tuple
 
 import httpx
+import orjson
 
-from .types import AppliedRule, Decision, EvaluationResult, OmegaScore
+from .types import Decision, EvaluationResult, OmegaScore
 from .exceptions import ConstitutionDeniedError, RateLimitError
 from .auth import PersonaAuthenticator
+from ._http import (
+    JSON_HEADERS,
+    RequestHeaders,
+    create_http_client,
+    default_headers,
+    dump_json,
+)
+
+
+class PreparedEvaluation(Protocol):
+    """Evaluator returned by ``ConstitutionClient.prepared_evaluate``."""
+    
+    def __call__(
+        self,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Awaitable[EvaluationResult]: ...
 
 
 class ConstitutionClient:
@@ -19,7 +37,11 @@ class ConstitutionClient:
     Client for the Constitution Agent API.
     
     Evaluates agent actions against the constitution and provides
-    alignment scoring.
+    alignment scoring. Rule lookups are cached for ``rule_cache_ttl``
+    seconds, and the rules and values listings are revalidated with
+    ETags so unchanged documents are not downloaded again. Each cache
+    holds up to ``rule_cache_size`` entries, evicting the least recently
+    used, and every call returns its own copy of the cached document.
     """
     
     def __init__(
@@ -29,34 +51,40 @@ class ConstitutionClient:
         agent_id: str,
         authenticator: Optional[PersonaAuthenticator] = None,
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rule_cache_ttl: float = 300.0,
+        rule_cache_size: int = 256,
+        pool_has_credentials: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.agent_id = agent_id
         self.authenticator = authenticator
         self.timeout = timeout
+        self.rule_cache_ttl = rule_cache_ttl
+        self.rule_cache_size = rule_cache_size
+        
+        # Raw response bodies, least recently used first; each hit decodes
+        # a fresh copy so callers cannot alter the cached document
+        self._rule_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._etag_cache: "OrderedDict[Tuple[Any, ...], Tuple[str, bytes]]" = (
+            OrderedDict()
+        )
         
-        self._client = httpx.AsyncClient(
-            base_url=f"{self.base_url}/v1/constitution",
+        # Share the caller's connection pool when one is provided
+        self._owns_client = http_client is None
+        self._client = http_client or create_http_client(
+            base_url=self.base_url,
+            headers=default_headers(self.api_key, self.agent_id),
             timeout=timeout,
-            headers=self._default_headers(),
         )
-    
-    def _default_headers(self) -> Dict[str, str]:
-        """Get default headers for requests."""
-        headers = {
-            "X-API-Key": self.api_key,
-            "X-Agent-ID": self.agent_id,
-            "Content-Type": "application/json",
-            "User-Agent": "bravozero-python/1.0.0",
-        }
-        return headers
-    
-    async def _get_attestation(self) -> Optional[str]:
-        """Get PERSONA attestation for request signing."""
-        if self.authenticator:
-            return await self.authenticator.create_attestation()
-        return None
+        # A pool without our default headers needs them on every request
+        self._headers = RequestHeaders(
+            authenticator,
+            None
+            if self._owns_client or pool_has_credentials
+            else default_headers(api_key, agent_id),
+        )
     
     async def evaluate(
         self,
@@ -79,19 +107,66 @@ class ConstitutionClient:
             ConstitutionDeniedError: If action is denied
             RateLimitError: If rate limit exceeded
         """
-        headers = {}
-        attestation = await self._get_attestation()
-        if attestation:
-            headers["X-Persona-Attestation"] = attestation
+        return await self._post_evaluate(dump_json({
+            "agentId": self.agent_id,
+            "action": action,
+            "context": context or {},
+            "priority": priority,
+        }))
+    
+    def prepared_evaluate(
+        self,
+        action: str,
+        priority: str = "normal",
+    ) -> PreparedEvaluation:
+        """
+        Bind an action and priority for repeated evaluation.
+        
+        This is the recommended API for high-throughput agents that
+        evaluate the same action many times: the request template is
+        built once, and calls without a context reuse a pre-serialized
+        body.
+        
+        Example:
+            ```python
+            check_read = client.constitution.prepared_evaluate("read_file")
+            result = await check_read({"path": "/src/main.py"})
+            ```
+        
+        Args:
+            action: The action to evaluate
+            priority: Request priority (normal, high, critical)
+        
+        Returns:
+            Coroutine function taking an optional context and returning
+            the EvaluationResult, with the same errors as ``evaluate``
+        """
+        template = {
+            "agentId": self.agent_id,
+            "action": action,
+            "context": {},
+            "priority": priority,
+        }
+        empty_context_body = dump_json(template)
+        
+        async def evaluate(
+            context: Optional[Dict[str, Any]] = None,
+        ) -> EvaluationResult:
+            if not context:
+                return await self._post_evaluate(empty_context_body)
+            return await self._post_evaluate(
+                dump_json({**template, "context": context})
+            )
+        
+        return evaluate
+    
+    async def _post_evaluate(self, body: bytes) -> EvaluationResult:
+        """Send a serialized evaluation request and check the decision."""
+        headers = await self._headers.signed(JSON_HEADERS)
         
         response = await self._client.post(
-            "/evaluate",
-            json={
-                "agentId": self.agent_id,
-                "action": action,
-                "context": context or {},
-                "priority": priority,
-            },
+            "/v1/constitution/evaluate",
+            content=body,
             headers=headers,
         )
         
@@ -103,25 +178,7 @@ class ConstitutionClient:
             )
         
         response.raise_for_status()
-        data = response.json()
-        
-        result = EvaluationResult(
-            request_id=data["requestId"],
-            decision=Decision(data["decision"]),
-            confidence=data["confidence"],
-            alignment_score=data["alignmentScore"],
-            applied_rules=[
-                AppliedRule(
-                    rule_id=r["ruleId"],
-                    name=r["name"],
-                    matched=r["matched"],
-                    contribution=r["contribution"],
-                )
-                for r in data.get("appliedRules", [])
-            ],
-            reasoning=data.get("reasoning", ""),
-            evaluated_at=datetime.fromisoformat(data["evaluatedAt"].replace("Z", "+00:00")),
-        )
+        result = EvaluationResult.model_validate_json(response.content)
         
         if result.decision == Decision.DENY:
             raise ConstitutionDeniedError(
@@ -138,16 +195,12 @@ class ConstitutionClient:
         Returns:
             OmegaScore with current value and components
         """
-        response = await self._client.get("/omega")
-        response.raise_for_status()
-        data = response.json()
-        
-        return OmegaScore(
-            omega=data["omega"],
-            components=data.get("components", {}),
-            trend=data.get("trend", "stable"),
-            timestamp=datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00")),
+        response = await self._client.get(
+            "/v1/constitution/omega",
+            headers=self._headers.unsigned(),
         )
+        response.raise_for_status()
+        return OmegaScore.model_validate_json(response.content)
     
     async def list_rules(
         self,
@@ -170,23 +223,36 @@ class ConstitutionClient:
         if priority:
             params["priority"] = priority
         
-        response = await self._client.get("/rules", params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_with_etag("/v1/constitution/rules", params)
     
     async def get_rule(self, rule_id: str) -> Dict[str, Any]:
         """
         Get a specific rule by ID.
         
+        Repeat lookups within ``rule_cache_ttl`` seconds are served from
+        memory.
+        
         Args:
             rule_id: The rule identifier
         
         Returns:
             Rule definition
         """
-        response = await self._client.get(f"/rules/{rule_id}")
+        cached = self._rule_cache.get(rule_id)
+        if cached and time.monotonic() - cached[0] < self.rule_cache_ttl:
+            self._rule_cache.move_to_end(rule_id)
+            return orjson.loads(cached[1])
+        
+        response = await self._client.get(
+            f"/v1/constitution/rules/{rule_id}",
+            headers=self._headers.unsigned(),
+        )
         response.raise_for_status()
-        return response.json()
+        rule = orjson.loads(response.content)
+        self._remember(
+            self._rule_cache, rule_id, (time.monotonic(), response.content)
+        )
+        return rule
     
     async def get_values(self) -> Dict[str, Any]:
         """
@@ -195,10 +261,53 @@ class ConstitutionClient:
         Returns:
             Values database with current value definitions
         """
-        response = await self._client.get("/values")
+        return await self._get_with_etag("/v1/constitution/values")
+    
+    async def _get_with_etag(
+        self,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """GET a JSON document, reusing the cached copy on 304 Not Modified."""
+        key = (path, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(key)
+        
+        response = await self._client.get(
+            path,
+            params=params,
+            headers=(
+                self._headers.unsigned({"If-None-Match": cached[0]})
+                if cached
+                else self._headers.unsigned()
+            ),
+        )
+        
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return orjson.loads(cached[1])
+        
         response.raise_for_status()
-        return response.json()
+        data = orjson.loads(response.content)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            self._remember(self._etag_cache, key, (etag, response.content))
+        return data
+    
+    def _remember(self, cache: "OrderedDict[Any, Any]", key: Any, entry: Any) -> None:
+        """Store ``entry`` in an LRU cache, evicting beyond ``rule_cache_size``."""
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > self.rule_cache_size:
+            cache.popitem(last=False)
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it is shared with other clients."""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def __aenter__(self) -> "ConstitutionClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -4,20 +4,100 @@ Memory Service Client
 Provides access to the Trace Manifold persistent memory system.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping,
+    Optional, Set, Tuple, TypeVar,
+)
 
 import httpx
 
-from .types import (
-    Memory,
-    MemoryType,
-    MemoryQueryResult,
-    Edge,
-    ConsolidationState,
-)
+from .types import ApiModel, Memory, MemoryQueryResult, Edge
 from .exceptions import MemoryError, RateLimitError
 from .auth import PersonaAuthenticator
+from ._http import (
+    JSON_HEADERS,
+    RequestHeaders,
+    create_http_client,
+    default_headers,
+    dump_json,
+)
+
+_T = TypeVar("_T")
+
+# Asks for one result per line so results can be decoded as they arrive
+_NDJSON_HEADERS = {"Accept": "application/x-ndjson"}
+
+# Status codes meaning the server has no such batch endpoint
+_BATCH_UNSUPPORTED = frozenset({404, 405})
+
+# Statuses meaning the server did not process the request, safe to retry
+# for any method
+_RETRY_STATUSES = frozenset({429, 503})
+
+# Gateway errors may arrive after the server applied the request, so
+# they are only retried for idempotent calls
+_RETRY_IDEMPOTENT_STATUSES = _RETRY_STATUSES | {502, 504}
+
+# Query cache entry: (expiry on the monotonic clock, results)
+_CachedQuery = Tuple[float, List[MemoryQueryResult]]
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds the server asked us to wait, from either Retry-After form."""
+    value = response.headers.get("Retry-After", "").strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _check_rate_limit(response: httpx.Response) -> None:
+    """Raise RateLimitError for a 429 response."""
+    if response.status_code == 429:
+        retry_after = _retry_after(response)
+        raise RateLimitError(
+            message="Rate limit exceeded",
+            retry_after=60 if retry_after is None else math.ceil(retry_after),
+        )
+
+
+# Wire formats of composite responses, decoded in a single pass
+
+class _QueryResponse(ApiModel):
+    results: List[MemoryQueryResult] = []
+
+
+class _RelatedResult(ApiModel):
+    memory: Memory
+    edge_strength: float
+
+
+class _RelatedResponse(ApiModel):
+    results: List[_RelatedResult] = []
+
+
+class _MemoryBatch(ApiModel):
+    items: List[Memory]
+
+
+class _QueryBatch(ApiModel):
+    items: List[_QueryResponse]
+
+
+class _EdgeBatch(ApiModel):
+    items: List[Edge]
 
 
 class MemoryClient:
@@ -26,6 +106,25 @@ class MemoryClient:
     
     Provides access to the Trace Manifold for storing and
     retrieving persistent memories.
+    
+    With ``query_cache_ttl`` > 0, results of ``query`` are cached
+    client-side. Queries that differ only in case or whitespace, with
+    identical filters, share an entry. The cache holds up to
+    ``query_cache_size`` entries, evicting the least recently used, and
+    is cleared whenever this client records, updates or deletes a
+    memory.
+    
+    Responses with status 429 or 503, and 502 or 504 for idempotent
+    calls, are retried up to ``max_retries`` times with jittered
+    exponential backoff that never undercuts the server's Retry-After.
+    No single wait exceeds ``max_backoff`` seconds: a Retry-After longer
+    than that is not waited out. A request still rate limited after
+    that raises ``RateLimitError``.
+    
+    Fan-outs (``get_many`` and the fallbacks of the batch methods) share
+    one limit of ``concurrency_limit`` requests in flight. Identical
+    ``get`` or ``query`` calls made while one is in flight share its
+    request instead of sending their own.
     """
     
     def __init__(
@@ -35,33 +134,211 @@ class MemoryClient:
         agent_id: str,
         authenticator: Optional[PersonaAuthenticator] = None,
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        query_cache_ttl: float = 0.0,
+        query_cache_size: int = 256,
+        max_retries: int = 3,
+        base_backoff: float = 0.1,
+        max_backoff: float = 30.0,
+        jitter: float = 0.1,
+        concurrency_limit: int = 32,
+        pool_has_credentials: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.agent_id = agent_id
         self.authenticator = authenticator
         self.timeout = timeout
+        self.query_cache_ttl = query_cache_ttl
+        self.query_cache_size = query_cache_size
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.concurrency_limit = concurrency_limit
+        
+        # Recent query results, least recently used first
+        self._query_cache: "OrderedDict[Tuple[Any, ...], _CachedQuery]" = OrderedDict()
+        
+        # Bumped by every write, so reads sent before it are neither cached
+        # nor shared with reads sent after it
+        self._write_generation = 0
+        
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
         
-        self._client = httpx.AsyncClient(
-            base_url=f"{self.base_url}/v1/memory",
+        # Requests in flight, keyed by request, shared by duplicates
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
+        
+        # Batch endpoints the server answered 404/405 for
+        self._unsupported_batch: Set[str] = set()
+        
+        self._owns_client = http_client is None
+        self._client = http_client or create_http_client(
+            base_url=self.base_url,
+            headers=default_headers(self.api_key, self.agent_id),
             timeout=timeout,
-            headers=self._default_headers(),
+        )
+        # A pool without our default headers needs them on every request
+        self._headers = RequestHeaders(
+            authenticator,
+            None
+            if self._owns_client or pool_has_credentials
+            else default_headers(api_key, agent_id),
         )
     
-    def _default_headers(self) -> Dict[str, str]:
-        """Get default headers for requests."""
-        return {
-            "X-API-Key": self.api_key,
-            "X-Agent-ID": self.agent_id,
-            "Content-Type": "application/json",
-            "User-Agent": "bravozero-python/1.0.0",
-        }
+    @classmethod
+    def from_shared(
+        cls,
+        http_client: httpx.AsyncClient,
+        api_key: str,
+        agent_id: str,
+        authenticator: Optional[PersonaAuthenticator] = None,
+    ) -> "MemoryClient":
+        """
+        Create a client on top of an existing connection pool.
+        
+        Use this instead of constructing a ``MemoryClient`` per request so
+        every call reuses warm connections. The pool's ``base_url`` must be
+        the API host; the credentials are sent with every request, so the
+        pool needs no default headers. ``close()`` leaves the pool open.
+        
+        Args:
+            http_client: Shared AsyncClient to issue requests through
+            api_key: API key for authentication
+            agent_id: PERSONA agent identifier
+            authenticator: Optional authenticator for signed requests
+        
+        Returns:
+            MemoryClient bound to the shared pool
+        """
+        return cls(
+            base_url=str(http_client.base_url),
+            api_key=api_key,
+            agent_id=agent_id,
+            authenticator=authenticator,
+            http_client=http_client,
+        )
     
-    async def _get_attestation(self) -> Optional[str]:
-        """Get PERSONA attestation for request signing."""
-        if self.authenticator:
-            return await self.authenticator.create_attestation()
-        return None
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        signed: bool = False,
+        idempotent: Optional[bool] = None,
+        stream: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying transient failures.
+        
+        429 and 503 responses are retried for every call. 502 and 504
+        are only retried for idempotent calls, since a gateway error can
+        arrive after the server has applied a write. Between attempts
+        it sleeps ``base_backoff * 2**attempt``, or longer if the
+        server's Retry-After asks for it, plus a random ``[0, jitter)``
+        so workers throttled at the same moment do not all retry at once.
+        The wait is capped at ``max_backoff``; a Retry-After beyond it
+        ends the retries, so a 429 raises at once.
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            signed: Attach a PERSONA attestation, signed per attempt
+            idempotent: Whether repeating the call is safe; defaults to
+                True for every method except POST
+            stream: Return before reading the body; the caller must
+                close the response
+            headers: Extra headers for this request
+            **kwargs: Passed through to ``httpx.AsyncClient.build_request``
+        
+        Returns:
+            The final response
+        
+        Raises:
+            RateLimitError: If still rate limited after ``max_retries``,
+                or asked to wait longer than ``max_backoff``
+        """
+        if idempotent is None:
+            idempotent = method != "POST"
+        retry_statuses = (
+            _RETRY_IDEMPOTENT_STATUSES if idempotent else _RETRY_STATUSES
+        )
+        extra: Tuple[Mapping[str, str], ...] = (
+            (JSON_HEADERS,) if "content" in kwargs else ()
+        )
+        if headers:
+            extra += (headers,)
+        
+        for attempt in range(self.max_retries + 1):
+            request = self._client.build_request(
+                method,
+                path,
+                headers=(
+                    await self._headers.signed(*extra)
+                    if signed
+                    else self._headers.unsigned(*extra)
+                ),
+                **kwargs,
+            )
+            response = await self._client.send(request, stream=stream)
+            if (
+                response.status_code not in retry_statuses
+                or attempt == self.max_retries
+            ):
+                break
+            
+            if stream:
+                await response.aclose()
+            delay = min(self.base_backoff * 2 ** attempt, self.max_backoff)
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.max_backoff:
+                    break
+                delay = max(delay, retry_after)
+            await asyncio.sleep(delay + random.uniform(0, self.jitter))
+        
+        if stream and response.status_code == 429:
+            await response.aclose()
+        _check_rate_limit(response)
+        return response
+    
+    async def _single_flight(
+        self,
+        key: Tuple[Any, ...],
+        call: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """
+        Run ``call`` once for concurrent requests with the same ``key``.
+        
+        Callers arriving while a request for ``key`` is in flight await
+        that request instead of sending their own. A caller that is
+        cancelled does not cancel the shared request for the others.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+    
+    def _invalidate_queries(self) -> None:
+        """Drop cached query results after a write."""
+        self._write_generation += 1
+        self._query_cache.clear()
+    
+    async def _fan_out(self, calls: Iterable[Awaitable[_T]]) -> List[_T]:
+        """Await calls concurrently, at most ``concurrency_limit`` at once."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency_limit)
+        semaphore = self._semaphore
+        
+        async def limited(call: Awaitable[_T]) -> _T:
+            async with semaphore:
+                return await call
+        
+        return list(await asyncio.gather(*(limited(call) for call in calls)))
     
     async def record(
         self,
@@ -86,33 +363,57 @@ class MemoryClient:
         Returns:
             The created Memory object
         """
-        headers = {}
-        attestation = await self._get_attestation()
-        if attestation:
-            headers["X-Persona-Attestation"] = attestation
-        
-        response = await self._client.post(
-            "/record",
-            json={
-                "content": content,
-                "memoryType": memory_type,
-                "importance": importance,
-                "namespace": namespace or self.agent_id,
-                "tags": tags or [],
-                "metadata": metadata or {},
-            },
-            headers=headers,
+        response = await self._request(
+            "POST",
+            "/v1/memory/record",
+            signed=True,
+            content=dump_json(self._record_body(
+                content, memory_type, importance, namespace, tags, metadata
+            )),
         )
         
-        if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", "60"))
-            raise RateLimitError(
-                message="Rate limit exceeded",
-                retry_after=retry_after,
+        response.raise_for_status()
+        self._invalidate_queries()
+        return Memory.model_validate_json(response.content)
+    
+    async def record_batch(self, items: List[Dict[str, Any]]) -> List[Memory]:
+        """
+        Record several memories in one round trip.
+        
+        Each item takes the same keyword arguments as ``record``. Prefer
+        this over calling ``record`` in a loop. If the server has no batch
+        endpoint, the items are recorded concurrently instead.
+        
+        Args:
+            items: Keyword arguments for each memory, e.g.
+                ``{"content": "...", "importance": 0.8}``
+        
+        Returns:
+            The created Memory objects, in the order of ``items``
+        """
+        if not items:
+            return []
+        
+        path = "/v1/memory/record:batch"
+        if path not in self._unsupported_batch:
+            response = await self._request(
+                "POST",
+                path,
+                signed=True,
+                content=dump_json({
+                    "items": [self._record_body(**item) for item in items],
+                }),
             )
+            
+            if response.status_code in _BATCH_UNSUPPORTED:
+                self._unsupported_batch.add(path)
+            else:
+                response.raise_for_status()
+                self._invalidate_queries()
+                batch = _MemoryBatch.model_validate_json(response.content)
+                return batch.items
         
-        response.raise_for_status()
-        return self._parse_memory(response.json())
+        return await self._fan_out(self.record(**item) for item in items)
     
     async def query(
         self,
@@ -122,6 +423,7 @@ class MemoryClient:
         memory_types: Optional[List[str]] = None,
         namespace: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        use_cache: bool = True,
     ) -> List[MemoryQueryResult]:
         """
         Query memories by semantic similarity.
@@ -133,32 +435,150 @@ class MemoryClient:
             memory_types: Filter by memory types
             namespace: Filter by namespace
             tags: Filter by tags
+            use_cache: Set to False to always ask the server, for
+                queries whose results must be fresh
         
         Returns:
             List of MemoryQueryResult with relevance scores
         """
-        response = await self._client.post(
-            "/query",
-            json={
-                "query": query,
-                "limit": limit,
-                "minRelevance": min_relevance,
-                "memoryTypes": memory_types,
-                "namespace": namespace,
-                "tags": tags,
-            },
+        caching = use_cache and self.query_cache_ttl > 0
+        if caching:
+            key = (
+                " ".join(query.casefold().split()),
+                limit,
+                min_relevance,
+                tuple(memory_types or ()),
+                namespace,
+                tuple(tags or ()),
+            )
+            cached = self._query_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self._query_cache.move_to_end(key)
+                return list(cached[1])
+        
+        content = dump_json(self._query_body(
+            query, limit, min_relevance, memory_types, namespace, tags
+        ))
+        generation = self._write_generation
+        results = await self._single_flight(
+            ("query", generation, content), lambda: self._post_query(content)
         )
         
+        # A write during the request may have made these results stale
+        if caching and generation == self._write_generation:
+            expires_at = time.monotonic() + self.query_cache_ttl
+            self._query_cache[key] = (expires_at, results)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        
+        # Concurrent duplicates share the decoded list; give each a copy
+        return list(results)
+    
+    async def _post_query(self, content: bytes) -> List[MemoryQueryResult]:
+        """Send a serialized query request."""
+        response = await self._request(
+            "POST", "/v1/memory/query", idempotent=True, content=content
+        )
         response.raise_for_status()
-        data = response.json()
+        return _QueryResponse.model_validate_json(response.content).results
+    
+    async def query_iter(
+        self,
+        query: str,
+        limit: int = 10,
+        min_relevance: float = 0.5,
+        memory_types: Optional[List[str]] = None,
+        namespace: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> AsyncIterator[MemoryQueryResult]:
+        """
+        Query memories, yielding results as they arrive.
         
-        return [
-            MemoryQueryResult(
-                memory=self._parse_memory(r["memory"]),
-                relevance=r["relevance"],
+        Asks the server for newline-delimited JSON, so each result is
+        decoded as soon as its line is received and a caller that stops
+        early does not pay for parsing the rest. Servers that answer
+        with a plain JSON document are read in full and then yielded
+        from. Bypasses the query cache. Retried like ``query`` until the
+        response starts; a stream that breaks off midway is not resent.
+        
+        Args:
+            query: Natural language query
+            limit: Maximum number of results
+            min_relevance: Minimum relevance threshold (0-1)
+            memory_types: Filter by memory types
+            namespace: Filter by namespace
+            tags: Filter by tags
+        
+        Yields:
+            MemoryQueryResult objects, most relevant first
+        """
+        response = await self._request(
+            "POST",
+            "/v1/memory/query",
+            idempotent=True,
+            stream=True,
+            headers=_NDJSON_HEADERS,
+            content=dump_json(self._query_body(
+                query, limit, min_relevance, memory_types, namespace, tags
+            )),
+        )
+        try:
+            response.raise_for_status()
+            
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.startswith("application/x-ndjson"):
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        yield MemoryQueryResult.model_validate_json(line)
+            else:
+                body = await response.aread()
+                for result in _QueryResponse.model_validate_json(body).results:
+                    yield result
+        finally:
+            await response.aclose()
+    
+    async def query_batch(
+        self,
+        queries: List[Dict[str, Any]],
+    ) -> List[List[MemoryQueryResult]]:
+        """
+        Run several memory queries in one round trip.
+        
+        Each entry takes the same keyword arguments as ``query``. If the
+        server has no batch endpoint, the queries run concurrently instead.
+        The batch endpoint always answers from the server; only the
+        fallback consults the query cache.
+        
+        Args:
+            queries: Keyword arguments for each query, e.g.
+                ``{"query": "user preferences", "limit": 5}``
+        
+        Returns:
+            One result list per query, in the order of ``queries``
+        """
+        if not queries:
+            return []
+        
+        path = "/v1/memory/query:batch"
+        if path not in self._unsupported_batch:
+            response = await self._request(
+                "POST",
+                path,
+                idempotent=True,
+                content=dump_json({
+                    "items": [self._query_body(**q) for q in queries],
+                }),
             )
-            for r in data.get("results", [])
-        ]
+            
+            if response.status_code in _BATCH_UNSUPPORTED:
+                self._unsupported_batch.add(path)
+            else:
+                response.raise_for_status()
+                batch = _QueryBatch.model_validate_json(response.content)
+                return [r.results for r in batch.items]
+        
+        return await self._fan_out(self.query(**q) for q in queries)
     
     async def get(self, memory_id: str) -> Memory:
         """
@@ -170,9 +590,33 @@ class MemoryClient:
         Returns:
             The Memory object
         """
-        response = await self._client.get(f"/{memory_id}")
+        return await self._single_flight(
+            ("get", self._write_generation, memory_id),
+            lambda: self._fetch_memory(memory_id),
+        )
+    
+    async def _fetch_memory(self, memory_id: str) -> Memory:
+        """Send a get request."""
+        response = await self._request("GET", f"/v1/memory/{memory_id}")
         response.raise_for_status()
-        return self._parse_memory(response.json())
+        return Memory.model_validate_json(response.content)
+    
+    async def get_many(self, memory_ids: List[str]) -> List[Memory]:
+        """
+        Get several memories concurrently.
+        
+        The requests share this client's connection pool, so over HTTP/2
+        they are multiplexed on one connection and the total wait is close
+        to a single round trip rather than one per ID. At most
+        ``concurrency_limit`` requests are in flight at once.
+        
+        Args:
+            memory_ids: The memory identifiers
+        
+        Returns:
+            The Memory objects, in the order of ``memory_ids``
+        """
+        return await self._fan_out(self.get(i) for i in memory_ids)
     
     async def update(
         self,
@@ -195,22 +639,67 @@ class MemoryClient:
         Returns:
             The updated Memory object
         """
-        update_data = {}
-        if content is not None:
-            update_data["content"] = content
-        if importance is not None:
-            update_data["importance"] = importance
-        if tags is not None:
-            update_data["tags"] = tags
-        if metadata is not None:
-            update_data["metadata"] = metadata
+        update_data = self._update_body(content, importance, tags, metadata)
+        if not update_data:
+            # Nothing to change; skip the empty PATCH
+            return await self.get(memory_id)
         
-        response = await self._client.patch(
-            f"/{memory_id}",
-            json=update_data,
+        response = await self._request(
+            "PATCH",
+            f"/v1/memory/{memory_id}",
+            content=dump_json(update_data),
         )
         response.raise_for_status()
-        return self._parse_memory(response.json())
+        self._invalidate_queries()
+        return Memory.model_validate_json(response.content)
+    
+    async def update_batch(
+        self,
+        updates: List[Tuple[str, Dict[str, Any]]],
+    ) -> List[Memory]:
+        """
+        Update several memories in one round trip.
+        
+        Each patch takes the same keyword arguments as ``update``. If the
+        server has no batch endpoint, the updates are sent concurrently
+        instead.
+        
+        Args:
+            updates: ``(memory_id, patch)`` pairs, e.g.
+                ``[("mem-1", {"importance": 0.9})]``
+        
+        Returns:
+            The updated Memory objects, in the order of ``updates``
+        """
+        if not updates:
+            return []
+        
+        path = "/v1/memory/:batch-update"
+        if path not in self._unsupported_batch:
+            response = await self._request(
+                "POST",
+                path,
+                # Sets absolute field values, so repeating it is harmless
+                idempotent=True,
+                content=dump_json({
+                    "updates": [
+                        {"id": memory_id, **self._update_body(**patch)}
+                        for memory_id, patch in updates
+                    ],
+                }),
+            )
+            
+            if response.status_code in _BATCH_UNSUPPORTED:
+                self._unsupported_batch.add(path)
+            else:
+                response.raise_for_status()
+                self._invalidate_queries()
+                batch = _MemoryBatch.model_validate_json(response.content)
+                return batch.items
+        
+        return await self._fan_out(
+            self.update(memory_id, **patch) for memory_id, patch in updates
+        )
     
     async def delete(self, memory_id: str) -> bool:
         """
@@ -222,8 +711,9 @@ class MemoryClient:
         Returns:
             True if deleted successfully
         """
-        response = await self._client.delete(f"/{memory_id}")
+        response = await self._request("DELETE", f"/v1/memory/{memory_id}")
         response.raise_for_status()
+        self._invalidate_queries()
         return True
     
     async def create_edge(
@@ -245,26 +735,51 @@ class MemoryClient:
         Returns:
             The created Edge
         """
-        response = await self._client.post(
-            "/edges",
-            json={
-                "sourceId": source_id,
-                "targetId": target_id,
-                "relationship": relationship,
-                "strength": strength,
-            },
+        response = await self._request(
+            "POST",
+            "/v1/memory/edges",
+            content=dump_json(self._edge_body(
+                source_id, target_id, relationship, strength
+            )),
         )
         response.raise_for_status()
-        data = response.json()
-        
-        return Edge(
-            source_id=data["sourceId"],
-            target_id=data["targetId"],
-            relationship=data["relationship"],
-            strength=data["strength"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            last_strengthened_at=datetime.fromisoformat(data["lastStrengthenedAt"].replace("Z", "+00:00")),
-        )
+        return Edge.model_validate_json(response.content)
+    
+    async def create_edges(self, edges: List[Dict[str, Any]]) -> List[Edge]:
+        """
+        Create several edges in one round trip.
+        
+        Each item takes the same keyword arguments as ``create_edge``.
+        If the server has no batch endpoint, the edges are created
+        concurrently instead.
+        
+        Args:
+            edges: Keyword arguments for each edge, e.g.
+                ``{"source_id": "a", "target_id": "b", "relationship": "cites"}``
+        
+        Returns:
+            The created Edges, in the order of ``edges``
+        """
+        if not edges:
+            return []
+        
+        path = "/v1/memory/edges:batch"
+        if path not in self._unsupported_batch:
+            response = await self._request(
+                "POST",
+                path,
+                content=dump_json({
+                    "items": [self._edge_body(**edge) for edge in edges],
+                }),
+            )
+            
+            if response.status_code in _BATCH_UNSUPPORTED:
+                self._unsupported_batch.add(path)
+            else:
+                response.raise_for_status()
+                return _EdgeBatch.model_validate_json(response.content).items
+        
+        return await self._fan_out(self.create_edge(**edge) for edge in edges)
     
     async def get_related(
         self,
@@ -292,39 +807,104 @@ class MemoryClient:
         if relationship:
             params["relationship"] = relationship
         
-        response = await self._client.get(
-            f"/{memory_id}/related",
+        response = await self._request(
+            "GET",
+            f"/v1/memory/{memory_id}/related",
             params=params,
         )
         response.raise_for_status()
-        data = response.json()
+        related = _RelatedResponse.model_validate_json(response.content)
         
         return [
-            MemoryQueryResult(
-                memory=self._parse_memory(r["memory"]),
-                relevance=r["edgeStrength"],
-            )
-            for r in data.get("results", [])
+            MemoryQueryResult(memory=r.memory, relevance=r.edge_strength)
+            for r in related.results
         ]
     
-    def _parse_memory(self, data: Dict[str, Any]) -> Memory:
-        """Parse a memory from API response."""
-        return Memory(
-            id=data["id"],
-            content=data["content"],
-            memory_type=MemoryType(data["memoryType"]),
-            importance=data["importance"],
-            strength=data.get("strength", 1.0),
-            consolidation_state=ConsolidationState(data.get("consolidationState", "active")),
-            namespace=data["namespace"],
-            tags=data.get("tags", []),
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            last_accessed_at=datetime.fromisoformat(data["lastAccessedAt"].replace("Z", "+00:00")),
-            access_count=data.get("accessCount", 0),
-            embedding=data.get("embedding"),
-            metadata=data.get("metadata", {}),
-        )
+    def _record_body(
+        self,
+        content: str,
+        memory_type: str = "semantic",
+        importance: float = 0.5,
+        namespace: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the wire format of a record request."""
+        return {
+            "content": content,
+            "memoryType": memory_type,
+            "importance": importance,
+            "namespace": namespace or self.agent_id,
+            "tags": tags or [],
+            "metadata": metadata or {},
+        }
+    
+    @staticmethod
+    def _update_body(
+        content: Optional[str] = None,
+        importance: Optional[float] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the wire format of an update, omitting unset fields."""
+        update_data: Dict[str, Any] = {}
+        if content is not None:
+            update_data["content"] = content
+        if importance is not None:
+            update_data["importance"] = importance
+        if tags is not None:
+            update_data["tags"] = tags
+        if metadata is not None:
+            update_data["metadata"] = metadata
+        return update_data
+    
+    @staticmethod
+    def _edge_body(
+        source_id: str,
+        target_id: str,
+        relationship: str,
+        strength: float = 0.5,
+    ) -> Dict[str, Any]:
+        """Build the wire format of an edge request."""
+        return {
+            "sourceId": source_id,
+            "targetId": target_id,
+            "relationship": relationship,
+            "strength": strength,
+        }
+    
+    def _query_body(
+        self,
+        query: str,
+        limit: int = 10,
+        min_relevance: float = 0.5,
+        memory_types: Optional[List[str]] = None,
+        namespace: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Build the wire format of a query request.
+        
+        Takes every keyword argument of ``query``; ``use_cache`` is not
+        part of the request and is ignored.
+        """
+        return {
+            "query": query,
+            "limit": limit,
+            "minRelevance": min_relevance,
+            "memoryTypes": memory_types,
+            "namespace": namespace,
+            "tags": tags,
+        }
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it is shared with other clients."""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def __aenter__(self) -> "MemoryClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
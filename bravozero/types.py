@@ -2,10 +2,61 @@
 Type definitions for Bravo Zero SDK
 """
 
+import base64
+import sys
+from array import array
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator
+from pydantic.alias_generators import to_camel
+
+
+class ApiModel(BaseModel):
+    """
+    Frozen model that validates straight from camelCase API JSON.
+    
+    ``Model.model_validate_json(response.content)`` builds the model
+    in a single pass without an intermediate dict. Fields can still be
+    passed by their snake_case names.
+    """
+    model_config = ConfigDict(
+        frozen=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+
+def _to_float32(value: Any) -> array:
+    """Pack an embedding into a float32 array.
+    
+    Accepts a list of numbers or base64 of little-endian float32 bytes.
+    """
+    if isinstance(value, array) and value.typecode == "f":
+        return value
+    if isinstance(value, (str, bytes)):
+        # binascii.Error and a ragged byte count are both ValueErrors,
+        # which pydantic reports as validation errors
+        packed = array("f")
+        packed.frombytes(base64.b64decode(value, validate=True))
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return packed
+    try:
+        return array("f", value)
+    except TypeError as exc:
+        raise ValueError(
+            "embedding must be a list of numbers or base64 float32 bytes"
+        ) from exc
+
+
+# Embedding vector stored as packed float32 (4 bytes per dimension rather
+# than a boxed Python float). Serializes back to a list of floats.
+Float32Vector = Annotated[
+    array,
+    PlainValidator(_to_float32),
+    PlainSerializer(array.tolist, return_type=List[float]),
+]
 
 
 class Decision(str, Enum):
@@ -32,7 +83,7 @@ class ConsolidationState(str, Enum):
     DORMANT = "dormant"
 
 
-class AppliedRule(BaseModel):
+class AppliedRule(ApiModel):
     """A rule that was applied during evaluation."""
     rule_id: str
     name: str
@@ -40,7 +91,7 @@ class AppliedRule(BaseModel):
     contribution: float
 
 
-class EvaluationResult(BaseModel):
+class EvaluationResult(ApiModel):
     """Result of a Constitution Agent evaluation."""
     request_id: str
     decision: Decision
@@ -49,52 +100,40 @@ class EvaluationResult(BaseModel):
     applied_rules: List[AppliedRule] = []
     reasoning: str = ""
     evaluated_at: datetime
-    
-    class Config:
-        frozen = True
 
 
-class OmegaScore(BaseModel):
+class OmegaScore(ApiModel):
     """Global Omega alignment score."""
     omega: float = Field(ge=0, le=1)
     components: Dict[str, float] = {}
-    trend: str  # "improving", "stable", "degrading"
+    trend: str = "stable"  # "improving", "stable", "degrading"
     timestamp: datetime
-    
-    class Config:
-        frozen = True
 
 
-class Memory(BaseModel):
+class Memory(ApiModel):
     """A memory from the Trace Manifold."""
     id: str
     content: str
     memory_type: MemoryType
     importance: float = Field(ge=0, le=1)
-    strength: float = Field(ge=0, le=1)
-    consolidation_state: ConsolidationState
+    strength: float = Field(default=1.0, ge=0, le=1)
+    consolidation_state: ConsolidationState = ConsolidationState.ACTIVE
     namespace: str
     tags: List[str] = []
     created_at: datetime
     last_accessed_at: datetime
     access_count: int = 0
-    embedding: Optional[List[float]] = None
+    embedding: Optional[Float32Vector] = None
     metadata: Dict[str, Any] = {}
-    
-    class Config:
-        frozen = True
 
 
-class MemoryQueryResult(BaseModel):
+class MemoryQueryResult(ApiModel):
     """Result from a memory query."""
     memory: Memory
     relevance: float = Field(ge=0, le=1)
-    
-    class Config:
-        frozen = True
 
 
-class Edge(BaseModel):
+class Edge(ApiModel):
     """An edge connecting two memories."""
     source_id: str
     target_id: str
@@ -102,12 +141,9 @@ class Edge(BaseModel):
     strength: float = Field(ge=0, le=1)
     created_at: datetime
     last_strengthened_at: datetime
-    
-    class Config:
-        frozen = True
 
 
-class FileInfo(BaseModel):
+class FileInfo(ApiModel):
     """Information about a file in the VFS."""
     path: str
     name: str
@@ -116,37 +152,25 @@ class FileInfo(BaseModel):
     modified_at: datetime
     created_at: Optional[datetime] = None
     permissions: str = ""
-    
-    class Config:
-        frozen = True
 
 
-class DirectoryListing(BaseModel):
+class DirectoryListing(ApiModel):
     """Listing of files in a directory."""
     path: str
     files: List[FileInfo]
     total_count: int
-    
-    class Config:
-        frozen = True
 
 
-class SyncStatus(BaseModel):
+class SyncStatus(ApiModel):
     """VFS synchronization status."""
     path: str
     synced: bool
     last_sync_at: Optional[datetime] = None
     pending_changes: int = 0
-    
-    class Config:
-        frozen = True
 
 
-class RateLimitInfo(BaseModel):
+class RateLimitInfo(ApiModel):
     """Rate limit information."""
     limit: int
     remaining: int
     reset_at: datetime
-    
-    class Config:
-        frozen = True
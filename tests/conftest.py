@@ -0,0 +1,35 @@
+"""Shared fixtures: clients wired to an in-process mock server."""
+
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from bravozero.memory import MemoryClient
+
+from .mock_server import MockServer, default_handler
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(default_handler)
+
+
+@pytest.fixture
+def make_client(server: MockServer) -> Callable[..., MemoryClient]:
+    def make(**kwargs: Any) -> MemoryClient:
+        pool = httpx.AsyncClient(
+            base_url="https://api.test",
+            transport=httpx.MockTransport(server),
+        )
+        kwargs.setdefault("base_backoff", 0.0)
+        kwargs.setdefault("jitter", 0.0)
+        return MemoryClient(
+            base_url="https://api.test",
+            api_key="key",
+            agent_id="agent",
+            http_client=pool,
+            **kwargs,
+        )
+    
+    return make
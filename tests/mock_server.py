@@ -0,0 +1,56 @@
+"""In-process stand-in for the Memory Service."""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+TIMESTAMP = "2024-05-01T12:00:00Z"
+
+
+def memory_json(memory_id: str = "mem-1", **fields: Any) -> Dict[str, Any]:
+    """Wire format of a Memory as the service returns it."""
+    return {
+        "id": memory_id,
+        "content": "content",
+        "memoryType": "semantic",
+        "importance": 0.5,
+        "namespace": "agent",
+        "createdAt": TIMESTAMP,
+        "lastAccessedAt": TIMESTAMP,
+        **fields,
+    }
+
+
+class MockServer:
+    """Routes requests to a handler and records every request it sees."""
+    
+    def __init__(self, handler: Callable[[httpx.Request], httpx.Response]):
+        self.handler = handler
+        self.requests: List[httpx.Request] = []
+        # Set to hold responses until the test releases them
+        self.gate: Optional[asyncio.Event] = None
+    
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.gate is not None:
+            await self.gate.wait()
+        return self.handler(request)
+    
+    def paths(self) -> List[str]:
+        return [request.url.path for request in self.requests]
+
+
+def default_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path == "/v1/memory/query":
+        return httpx.Response(
+            200,
+            json={"results": [{"memory": memory_json(), "relevance": 0.9}]},
+        )
+    if path == "/v1/memory/record" or path.startswith("/v1/memory/mem-"):
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json=memory_json(path.rsplit("/", 1)[1]))
+    return httpx.Response(404)
+
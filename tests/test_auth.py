@@ -0,0 +1,88 @@
+"""Tests for PERSONA attestation signing."""
+
+import base64
+import json
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from bravozero.auth import PersonaAuthenticator
+
+
+def make_authenticator(**kwargs) -> PersonaAuthenticator:
+    key = Ed25519PrivateKey.generate()
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return PersonaAuthenticator(
+        agent_id="agent-é", private_key_bytes=pem, **kwargs
+    )
+
+
+async def test_attestation_bytes_match_json_dumps():
+    authenticator = make_authenticator()
+    
+    for action, nonce in [('read "file"', "n-1"), (None, None)]:
+        envelope = base64.b64decode(
+            await authenticator.create_attestation(action, nonce)
+        )
+        attestation = json.loads(envelope)
+        payload = base64.b64decode(attestation["payload"])
+        fields = json.loads(payload)
+        
+        expected = {
+            "agent_id": "agent-é",
+            "timestamp": fields["timestamp"],
+            "nonce": nonce or fields["nonce"],
+        }
+        if action:
+            expected["action"] = action
+        assert payload == json.dumps(expected, sort_keys=True).encode()
+        assert envelope == json.dumps({
+            "payload": attestation["payload"],
+            "signature": attestation["signature"],
+            "algorithm": "Ed25519",
+        }).encode()
+        
+        # Raises InvalidSignature on mismatch
+        public_key = serialization.load_pem_public_key(
+            authenticator.get_public_key()
+        )
+        public_key.verify(base64.b64decode(attestation["signature"]), payload)
+
+
+async def test_prehashed_attestation_verifies_as_ed25519ph():
+    bindings = pytest.importorskip("nacl.bindings")
+    authenticator = make_authenticator(prehash=True)
+    
+    attestation = json.loads(base64.b64decode(
+        await authenticator.create_attestation("read_file")
+    ))
+    payload = base64.b64decode(attestation["payload"])
+    
+    assert attestation["algorithm"] == "Ed25519ph"
+    state = bindings.crypto_sign_ed25519ph_state()
+    bindings.crypto_sign_ed25519ph_update(state, payload)
+    assert bindings.crypto_sign_ed25519ph_final_verify(
+        state,
+        base64.b64decode(attestation["signature"]),
+        base64.b64decode(authenticator.get_public_key_base64()),
+    )
+
+
+async def test_raw_envelope_is_plain_json():
+    authenticator = make_authenticator(raw_envelope=True)
+    
+    raw = await authenticator.create_attestation("read_file", "n-1")
+    attestation = json.loads(raw)
+    payload = base64.b64decode(attestation["payload"])
+    
+    assert json.loads(payload)["action"] == "read_file"
+    assert attestation["algorithm"] == "Ed25519"
+    public_key = serialization.load_pem_public_key(
+        authenticator.get_public_key()
+    )
+    public_key.verify(base64.b64decode(attestation["signature"]), payload)
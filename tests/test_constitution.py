@@ -0,0 +1,50 @@
+"""Tests for ConstitutionClient caching."""
+
+import httpx
+
+from bravozero.constitution import ConstitutionClient
+
+from .mock_server import MockServer
+
+
+def rule_handler(request: httpx.Request) -> httpx.Response:
+    rule_id = request.url.path.rsplit("/", 1)[1]
+    return httpx.Response(200, json={"id": rule_id, "tags": ["safety"]})
+
+
+def make_constitution(server: MockServer, **kwargs) -> ConstitutionClient:
+    pool = httpx.AsyncClient(
+        base_url="https://api.test",
+        transport=httpx.MockTransport(server),
+    )
+    return ConstitutionClient(
+        base_url="https://api.test",
+        api_key="key",
+        agent_id="agent",
+        http_client=pool,
+        **kwargs,
+    )
+
+
+async def test_cached_rule_cannot_be_mutated_by_callers():
+    server = MockServer(rule_handler)
+    client = make_constitution(server)
+    
+    first = await client.get_rule("r1")
+    first["tags"].append("changed")
+    second = await client.get_rule("r1")
+    
+    assert second == {"id": "r1", "tags": ["safety"]}
+    assert len(server.requests) == 1
+
+
+async def test_rule_cache_evicts_least_recently_used():
+    server = MockServer(rule_handler)
+    client = make_constitution(server, rule_cache_size=2)
+    
+    await client.get_rule("r1")
+    await client.get_rule("r2")
+    await client.get_rule("r1")
+    await client.get_rule("r3")
+    
+    assert list(client._rule_cache) == ["r1", "r3"]
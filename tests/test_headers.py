@@ -0,0 +1,28 @@
+"""Tests for the credentials and headers sent with each request."""
+
+from bravozero import Client
+
+
+async def test_injected_pool_gets_credentials_and_content_type(
+    server, make_client
+):
+    client = make_client()
+    
+    await client.record("x")
+    await client.get("mem-1")
+    
+    post, get = server.requests
+    assert post.headers["X-API-Key"] == "key"
+    assert post.headers["X-Agent-ID"] == "agent"
+    assert post.headers["Content-Type"] == "application/json"
+    assert get.headers["X-API-Key"] == "key"
+
+
+async def test_client_pool_credentials_are_not_repeated_per_request():
+    client = Client(api_key="key", agent_id="agent")
+    
+    assert client._http.headers["X-API-Key"] == "key"
+    for service in (client.constitution, client.memory, client.bridge):
+        assert service._headers.unsigned() is None
+    
+    await client.close()
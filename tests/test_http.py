@@ -0,0 +1,12 @@
+"""Tests for the shared connection pool configuration."""
+
+from bravozero._http import create_http_client
+
+
+async def test_pool_routes_through_environment_proxy(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:3128")
+    
+    client = create_http_client("https://api.test", {}, timeout=30.0)
+    
+    assert client._mounts
+    await client.aclose()
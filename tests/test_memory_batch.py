@@ -0,0 +1,55 @@
+"""Tests for the MemoryClient batch APIs."""
+
+import httpx
+
+from .mock_server import memory_json
+
+
+async def test_record_batch_falls_back_to_single_records(server, make_client):
+    client = make_client()
+    
+    memories = await client.record_batch([{"content": "a"}, {"content": "b"}])
+    await client.record_batch([{"content": "c"}])
+    
+    assert [m.id for m in memories] == ["record", "record"]
+    # The missing batch endpoint is only probed once
+    assert server.paths() == [
+        "/v1/memory/record:batch",
+        "/v1/memory/record",
+        "/v1/memory/record",
+        "/v1/memory/record",
+    ]
+
+
+async def test_record_batch_uses_batch_endpoint(server, make_client):
+    server.handler = lambda request: httpx.Response(
+        200, json={"items": [memory_json("a"), memory_json("b")]}
+    )
+    client = make_client()
+    
+    memories = await client.record_batch([{"content": "a"}, {"content": "b"}])
+    
+    assert [m.id for m in memories] == ["a", "b"]
+    assert server.paths() == ["/v1/memory/record:batch"]
+
+
+async def test_query_batch_accepts_query_arguments_on_both_paths(
+    server, make_client
+):
+    queries = [{"query": "q", "limit": 5, "use_cache": False}]
+    
+    fallback = await make_client().query_batch(queries)
+    server.handler = lambda request: httpx.Response(
+        200,
+        json={"items": [{"results": [
+            {"memory": memory_json(), "relevance": 0.9}
+        ]}]},
+    )
+    batched = await make_client().query_batch(queries)
+    
+    assert fallback == batched
+    assert server.paths() == [
+        "/v1/memory/query:batch",
+        "/v1/memory/query",
+        "/v1/memory/query:batch",
+    ]
@@ -0,0 +1,30 @@
+"""Tests for the MemoryClient query cache."""
+
+import asyncio
+
+
+async def test_query_cache_is_cleared_by_writes(server, make_client):
+    client = make_client(query_cache_ttl=60)
+    
+    await client.query("User  Preferences")
+    await client.query("user preferences")
+    assert server.paths().count("/v1/memory/query") == 1
+    
+    await client.delete("mem-1")
+    await client.query("user preferences")
+    assert server.paths().count("/v1/memory/query") == 2
+
+
+async def test_query_in_flight_during_write_is_not_cached(server, make_client):
+    client = make_client(query_cache_ttl=60)
+    gate = server.gate = asyncio.Event()
+    
+    query = asyncio.ensure_future(client.query("q"))
+    while not server.requests:
+        await asyncio.sleep(0)
+    server.gate = None
+    await client.delete("mem-1")
+    gate.set()
+    await query
+    
+    assert client._query_cache == {}
@@ -0,0 +1,44 @@
+"""Tests for MemoryClient request coalescing."""
+
+import asyncio
+
+
+async def test_concurrent_duplicate_gets_share_one_request(server, make_client):
+    client = make_client()
+    server.gate = asyncio.Event()
+    
+    calls = [asyncio.ensure_future(client.get("mem-1")) for _ in range(3)]
+    calls.append(asyncio.ensure_future(client.get("mem-2")))
+    await asyncio.sleep(0)
+    server.gate.set()
+    first, second, third, other = await asyncio.gather(*calls)
+    
+    assert first is second is third
+    assert other.id == "mem-2"
+    assert server.paths() == ["/v1/memory/mem-1", "/v1/memory/mem-2"]
+    assert client._inflight == {}
+
+
+async def test_gets_after_completion_are_sent_again(server, make_client):
+    client = make_client()
+    
+    await client.get("mem-1")
+    await client.get("mem-1")
+    
+    assert len(server.requests) == 2
+
+
+async def test_get_after_write_does_not_join_earlier_get(server, make_client):
+    client = make_client()
+    gate = server.gate = asyncio.Event()
+    
+    stale = asyncio.ensure_future(client.get("mem-1"))
+    while not server.requests:
+        await asyncio.sleep(0)
+    server.gate = None
+    await client.update("mem-1", content="new")
+    fresh = asyncio.ensure_future(client.get("mem-1"))
+    gate.set()
+    await asyncio.gather(stale, fresh)
+    
+    assert [r.method for r in server.requests] == ["GET", "PATCH", "GET"]
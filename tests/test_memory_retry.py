@@ -0,0 +1,101 @@
+"""Tests for MemoryClient retries and backoff."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from bravozero.exceptions import RateLimitError
+
+from .mock_server import memory_json
+
+
+async def test_rate_limit_raises_after_retries_exhausted(server, make_client):
+    server.handler = lambda request: httpx.Response(
+        429, headers={"Retry-After": "0"}
+    )
+    client = make_client(max_retries=2)
+    
+    with pytest.raises(RateLimitError) as exc_info:
+        await client.get("mem-1")
+    
+    assert exc_info.value.retry_after == 0
+    assert len(server.requests) == 3
+
+
+async def test_retry_succeeds_after_transient_errors(server, make_client):
+    statuses = iter([503, 502])
+    server.handler = lambda request: httpx.Response(
+        next(statuses, 200), json=memory_json()
+    )
+    client = make_client()
+    
+    memory = await client.get("mem-1")
+    
+    assert memory.id == "mem-1"
+    assert len(server.requests) == 3
+
+
+async def test_gateway_errors_are_not_retried_for_writes(server, make_client):
+    server.handler = lambda request: httpx.Response(504)
+    client = make_client()
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.record("x")
+    
+    assert len(server.requests) == 1
+
+
+async def test_backoff_waits_at_least_retry_after(server, make_client, monkeypatch):
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    server.handler = lambda request: httpx.Response(
+        429, headers={"Retry-After": "20"}
+    )
+    client = make_client(max_retries=2, base_backoff=0.1)
+    
+    with pytest.raises(RateLimitError):
+        await client.get("mem-1")
+    
+    assert delays == [20.0, 20.0]
+
+
+async def test_retry_after_beyond_max_backoff_raises_at_once(
+    server, make_client, monkeypatch
+):
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    server.handler = lambda request: httpx.Response(
+        429, headers={"Retry-After": "3600"}
+    )
+    client = make_client(max_retries=2, max_backoff=30.0)
+    
+    with pytest.raises(RateLimitError) as excinfo:
+        await client.get("mem-1")
+    
+    assert excinfo.value.retry_after == 3600
+    assert delays == []
+    assert len(server.requests) == 1
+
+
+async def test_query_iter_retries_before_streaming(server, make_client):
+    statuses = iter([503])
+    server.handler = lambda request: httpx.Response(
+        next(statuses, 200),
+        json={"results": [{"memory": memory_json(), "relevance": 0.9}]},
+    )
+    client = make_client()
+    
+    results = [result async for result in client.query_iter("q")]
+    
+    assert [r.memory.id for r in results] == ["mem-1"]
+    assert len(server.requests) == 2
+    assert server.requests[0].headers["Accept"] == "application/x-ndjson"